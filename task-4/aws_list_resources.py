@@ -10,62 +10,193 @@ Supported services (so far):
   - lambda     : Lambda functions
 
 Requires: boto3
+Optional: aioboto3 (concurrent S3 region lookups and DynamoDB describe_table calls),
+          orjson (faster --format json/ndjson encoding)
 """
 
 import argparse
+import hashlib
+import io
+import json
+import os
 import sys
+import tempfile
+import time
 from datetime import datetime
-from typing import List, Dict, Any
-
-import boto3
-from botocore.exceptions import (
-    NoCredentialsError,
-    PartialCredentialsError,
-    ClientError,
-    EndpointConnectionError,
-    UnknownServiceError,
-    NoRegionError,
-    ParamValidationError,
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Iterator, Optional, TextIO, Tuple
+
+# boto3/botocore (and aioboto3) are imported on first use: they dominate
+# start-up time, and --help or a bad argument should not pay for them.
+# asyncio and concurrent.futures are likewise imported by their callers.
+
+# JMESPath projection of describe_instances down to the printed columns
+EC2_INSTANCE_FIELDS = (
+    "Reservations[].Instances[].[InstanceId, State.Name, InstanceType, "
+    "Placement.AvailabilityZone, LaunchTime, Tags[?Key=='Name'].Value | [0]]"
 )
 
+# Max in-flight GetBucketLocation calls when aioboto3 is available
+S3_LOCATION_CONCURRENCY = 20
+# Max in-flight DynamoDB describe_table calls (threads, or coroutines with aioboto3)
+DYNAMODB_DESCRIBE_CONCURRENCY = 16
+
+# Shared client settings. The pool is large enough for the concurrent
+# describe_table / get_bucket_location bursts, and TCP keepalive lets those
+# follow-up calls reuse established TLS connections instead of re-handshaking.
+_RETRIES = {"mode": "adaptive", "max_attempts": 5}
+# Best-effort extras (e.g. ListDirectoryBuckets) get one attempt and no retries,
+# and short timeouts instead of botocore's 60 s so an unreachable endpoint
+# can't stall the listing they decorate
+_NO_RETRIES = {"total_max_attempts": 1}
+_BEST_EFFORT_TIMEOUTS = {"connect_timeout": 3, "read_timeout": 3}
+_USER_AGENT = "aws-list-resources/1"
+
+OUTPUT_FORMATS = ("table", "json", "ndjson")
+
+# On-disk caches for lookups that rarely (or never) change
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "aws_list_resources")
+S3_LOCATION_TTL = None  # bucket regions are immutable
+DYNAMODB_DESCRIBE_TTL = 15 * 60
+
 # -------- Helpers -------- #
 
-def human_ts(dt: Any) -> str:
+@lru_cache(maxsize=None)
+def client_config(best_effort: bool = False):
+    from botocore.config import Config
+    return Config(
+        max_pool_connections=32,
+        retries=_NO_RETRIES if best_effort else _RETRIES,
+        tcp_keepalive=True,
+        user_agent_extra=_USER_AGENT,
+        **(_BEST_EFFORT_TIMEOUTS if best_effort else {}),
+    )
+
+@lru_cache(maxsize=None)
+def _aioboto3():
+    """The aioboto3 module, or None when it is not installed."""
     try:
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
-    except Exception:
-        return str(dt)
+        import aioboto3
+    except ImportError:  # optional; fall back to sequential boto3 calls
+        return None
+    return aioboto3
 
-def print_header(title: str):
-    print("=" * len(title))
-    print(title)
-    print("=" * len(title))
+@lru_cache(maxsize=None)
+def async_client_config(best_effort: bool = False):
+    # aiobotocore needs its own Config subclass; aiohttp keeps connections alive
+    from aiobotocore.config import AioConfig
+    return AioConfig(
+        max_pool_connections=32,
+        retries=_NO_RETRIES if best_effort else _RETRIES,
+        user_agent_extra=_USER_AGENT,
+        **(_BEST_EFFORT_TIMEOUTS if best_effort else {}),
+    )
 
-def print_table(rows: List[List[str]], headers: List[str]):
+def human_ts(dt: Any) -> str:
+    if isinstance(dt, datetime):
+        # Same text as strftime("%Y-%m-%d %H:%M:%S") without its format parser;
+        # tzinfo is dropped (not converted) so no "+00:00" suffix is appended
+        return dt.replace(microsecond=0, tzinfo=None).isoformat(sep=" ")
+    return "" if dt is None else str(dt)
+
+def print_header(title: str, out: Optional[TextIO] = None):
+    print("=" * len(title), file=out)
+    print(title, file=out)
+    print("=" * len(title), file=out)
+
+def print_table(rows: List[List[str]], headers: List[str], out: Optional[TextIO] = None):
     if not rows:
-        print("(no resources found)")
+        print("(no resources found)", file=out)
         return
-    # compute column widths
-    widths = [len(h) for h in headers]
-    for r in rows:
-        for i, col in enumerate(r):
-            widths[i] = max(widths[i], len(col))
+    # compute column widths (one pass per column, inner loops stay in C)
+    widths = [max(map(len, col)) for col in zip(headers, *rows)]
+
+    fmt = row_format(widths)
+    out = out or sys.stdout
+    out.write(fmt.format(*headers) + "\n")
+    out.write("-+-".join("-" * w for w in widths) + "\n")
+    # writelines goes through the buffered writer instead of one print per row
+    out.writelines(fmt.format(*r) + "\n" for r in rows)
 
-    # header
-    header_line = " | ".join(h.ljust(widths[i]) for i, h in enumerate(headers))
-    sep_line = "-+-".join("-" * widths[i] for i in range(len(headers)))
-    print(header_line)
-    print(sep_line)
+def row_format(widths: List[int]) -> str:
+    """Precompiled str.format template that left-pads each column to its width."""
+    return " | ".join(f"{{:<{w}}}" for w in widths)
 
-    # rows
+def print_row(row: List[str], widths: List[int], fmt: Optional[str] = None,
+              out: Optional[TextIO] = None):
+    """Print one row padded to fixed widths, truncating cells that don't fit."""
+    cells = (c if len(c) <= w else c[: w - 3] + "..." for c, w in zip(row, widths))
+    print((fmt or row_format(widths)).format(*cells), file=out)
+
+def print_stream(rows: Iterable[List[str]], headers: List[str], widths: List[int],
+                 out: Optional[TextIO] = None):
+    """Like print_table, but prints each row as soon as it is produced."""
+    fmt = row_format(widths)
+    empty = True
     for r in rows:
-        print(" | ".join(r[i].ljust(widths[i]) for i in range(len(headers))))
+        if empty:
+            print_row(headers, widths, fmt, out)
+            print("-+-".join("-" * w for w in widths), file=out)
+            empty = False
+        print_row(r, widths, fmt, out)
+    if empty:
+        print("(no resources found)", file=out)
+
+@lru_cache(maxsize=None)
+def _json_dumps():
+    """Compact JSON encoder returning str: orjson when installed, else stdlib json."""
+    try:
+        import orjson
+    except ImportError:
+        return lambda obj: json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return lambda obj: orjson.dumps(obj).decode()
+
+def section_title(service: str, region: str) -> str:
+    return f"{SERVICE_TITLES[service]} in {region}"
+
+def emit(service: str, region: str, columns: List[Tuple[str, int]], rows: Iterable[List[str]],
+         *, stream: bool = False, out: Optional[TextIO] = None, output: str = "table",
+         collect: Optional[List[Dict[str, str]]] = None):
+    """
+    Print service's rows in region as a titled table to out (default
+    stdout). columns holds (header, stream width) pairs; the fixed widths
+    are only used with stream=True, where rows are not buffered.
+
+    output="json" writes one compact JSON array of {header: value} objects
+    (no title); output="ndjson" writes one such object per line as rows
+    arrive, regardless of stream, each tagged with a "service" field.
+    With output="json" and a collect list, the objects are appended to it
+    instead of written, so a caller can encode several listings at once.
+    """
+    headers = [h for h, _ in columns]
+    if output in ("json", "ndjson"):
+        dumps = _json_dumps()
+        out = out or sys.stdout
+        if output == "ndjson":
+            out.writelines(dumps(dict(service=service, **dict(zip(headers, r)))) + "\n"
+                           for r in rows)
+        elif collect is not None:
+            collect.extend([dict(zip(headers, r)) for r in rows])
+        else:
+            out.write(dumps([dict(zip(headers, r)) for r in rows]) + "\n")
+        return
+    title = section_title(service, region)
+    if stream:
+        print_header(title, out)
+        print_stream(rows, headers, [w for _, w in columns], out)
+        return
+    rows = list(rows)
+    print_header(title, out)
+    print_table(rows, headers, out)
 
 def fail(msg: str, code: int = 1):
     print(f"Error: {msg}", file=sys.stderr)
     sys.exit(code)
 
 def get_session(profile: str = None, region: str = None):
+    import boto3
+    from botocore.exceptions import NoRegionError
+
     try:
         if profile:
             return boto3.Session(profile_name=profile, region_name=region)
@@ -75,80 +206,404 @@ def get_session(profile: str = None, region: str = None):
     except Exception as e:
         fail(f"Failed to initialize AWS session: {e}")
 
+class DiskCache:
+    """
+    Best-effort JSON cache stored as {key: {..., "ts": epoch}}.
+    Loaded lazily on first lookup and written atomically by save().
+    A ttl of None means entries never expire. Entries missing any of
+    fields (or otherwise malformed) are treated as misses.
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = None, fields: Tuple[str, ...] = ()):
+        self.path = path
+        self.ttl = ttl
+        self.fields = fields
+        self.enabled = True
+        self.refresh = False
+        self._data = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Any]:
+        if self._data is None:
+            try:
+                with open(self.path) as f:
+                    self._data = json.load(f)
+            except (OSError, ValueError):
+                self._data = {}
+            if not isinstance(self._data, dict):
+                self._data = {}
+        return self._data
+
+    def _valid(self, entry: Any, now: float) -> bool:
+        if not isinstance(entry, dict) or any(f not in entry for f in self.fields):
+            return False
+        ts = entry.get("ts", 0)
+        if not isinstance(ts, (int, float)):
+            return False
+        return self.ttl is None or now - ts < self.ttl
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled or self.refresh:
+            return None
+        entry = self._load().get(key)
+        return entry if self._valid(entry, time.time()) else None
+
+    def put(self, key: str, value: Dict[str, Any]):
+        if not self.enabled:
+            return
+        self._load()[key] = dict(value, ts=time.time())
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        # Drop expired and malformed entries so the file doesn't grow forever
+        now = time.time()
+        self._data = {k: v for k, v in self._data.items() if self._valid(v, now)}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._data, f)
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError:
+            # The cache is an optimization only; never fail the listing over it
+            pass
+
+S3_LOCATION_CACHE = DiskCache(
+    os.path.join(CACHE_DIR, "s3_locations.json"), S3_LOCATION_TTL, fields=("region",)
+)
+DYNAMODB_TABLE_CACHE = DiskCache(
+    os.path.join(CACHE_DIR, "dynamodb_tables.json"), DYNAMODB_DESCRIBE_TTL,
+    fields=("status", "items", "size"),
+)
+CACHES = (S3_LOCATION_CACHE, DYNAMODB_TABLE_CACHE)
+
 # -------- Service handlers -------- #
 
-def list_ec2(session, region: str):
-    """List EC2 instances in region."""
-    ec2 = session.client("ec2", region_name=region)
+SERVICE_TITLES = {
+    "ec2": "EC2 Instances",
+    "s3": "S3 Buckets",
+    "dynamodb": "DynamoDB Tables",
+    "rds": "RDS DB Instances",
+    "lambda": "Lambda Functions",
+}
+
+# (header, --stream width) pairs; widths follow AWS documented maximum lengths
+# where they are small, and truncate free-form values such as tags.
+EC2_COLUMNS = [
+    ("InstanceId", 19), ("State", 13), ("Type", 32),
+    ("AZ", 15), ("LaunchTime", 19), ("Name", 40),
+]
+
+def _iter_ec2(session, region: str, states: Optional[List[str]] = None) -> Iterator[List[str]]:
+    ec2 = session.client("ec2", region_name=region, config=client_config())
     paginator = ec2.get_paginator("describe_instances")
-    rows = []
-    for page in paginator.paginate():
-        for reservation in page.get("Reservations", []):
-            for inst in reservation.get("Instances", []):
-                inst_id = inst.get("InstanceId", "")
-                inst_type = inst.get("InstanceType", "")
-                state = (inst.get("State") or {}).get("Name", "")
-                az = (inst.get("Placement") or {}).get("AvailabilityZone", "")
-                launch = human_ts(inst.get("LaunchTime"))
-                # Try to get Name tag
-                name = ""
-                for t in inst.get("Tags", []) or []:
-                    if t.get("Key") == "Name":
-                        name = t.get("Value", "")
-                        break
-                rows.append([inst_id, state, inst_type, az, launch, name])
-    print_header(f"EC2 Instances in {region}")
-    print_table(rows, ["InstanceId", "State", "Type", "AZ", "LaunchTime", "Name"])
-
-def list_s3(session, region: str):
+    kwargs = {"PaginationConfig": {"PageSize": 1000}}  # API max for MaxResults
+    if states:
+        kwargs["Filters"] = [{"Name": "instance-state-name", "Values": states}]
+    # Project only the columns we print; the Name tag is resolved in the expression
+    return (
+        [inst_id or "", state or "", inst_type or "", az or "", human_ts(launch), name or ""]
+        for inst_id, state, inst_type, az, launch, name
+        in paginator.paginate(**kwargs).search(EC2_INSTANCE_FIELDS)
+    )
+
+def list_ec2(session, region: str, states: Optional[List[str]] = None, stream: bool = False,
+             out: Optional[TextIO] = None, output: str = "table",
+             collect: Optional[List[Dict[str, str]]] = None):
+    """List EC2 instances in region, optionally only those in the given states."""
+    rows = _iter_ec2(session, region, states)
+    emit("ec2", region, EC2_COLUMNS, rows,
+         stream=stream, out=out, output=output, collect=collect)
+
+def _cached_location(name: str) -> Optional[str]:
+    entry = S3_LOCATION_CACHE.get(name)
+    return entry["region"] if entry else None
+
+def _remember_location(name: str, bucket_region: Optional[str]) -> Optional[str]:
+    if bucket_region:
+        S3_LOCATION_CACHE.put(name, {"region": bucket_region})
+    return bucket_region
+
+def _location_region(loc: Dict[str, Any]) -> str:
     """
-    List S3 buckets whose bucket location matches the requested region.
-    Note: S3 is a global service; each bucket has its own location.
+    Region from a GetBucketLocation response. GetBucketLocation answers from
+    any regional endpoint in one round-trip; HeadBucket would be redirected
+    by botocore to the bucket's own region, costing a second request.
     """
-    s3 = session.client("s3")
+    # AWS quirk: us-east-1 is reported as None
+    return loc.get("LocationConstraint") or "us-east-1"
+
+def _s3_rows(buckets: List[Dict[str, Any]], regions: List[Any], region: str):
+    """Build S3 rows from buckets and their resolved regions (or lookup errors)."""
+    from botocore.exceptions import ClientError
+
     rows = []
-    resp = s3.list_buckets()
+    for b, bucket_region in zip(buckets, regions):
+        if isinstance(bucket_region, ClientError):
+            # If access denied to a bucket, skip it gracefully
+            continue
+        if isinstance(bucket_region, BaseException):
+            raise bucket_region
+        if bucket_region == region:
+            created = human_ts(b.get("CreationDate"))
+            rows.append([b.get("Name"), bucket_region, created])
+    return rows
+
+def _list_directory_buckets_sync(s3) -> List[Dict[str, Any]]:
+    """
+    S3 Express One Zone directory buckets are not returned by list_buckets.
+    ListDirectoryBuckets is regional, so every result lives in the client's
+    region and needs no GetBucketLocation lookup.
+
+    This is a best-effort extra: it goes to a separate host
+    (s3express-control.<region>) that only exists in a few regions, so s3
+    should be a no-retry client_config(best_effort=True) client, and any
+    failure just means "no directory buckets".
+    """
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    if not s3.can_paginate("list_directory_buckets"):
+        return []  # botocore predates S3 Express One Zone
+    try:
+        pages = s3.get_paginator("list_directory_buckets").paginate()
+        return [b for page in pages for b in page.get("Buckets", [])]
+    except (ClientError, BotoCoreError):
+        # Unreachable / not offered in this region, or no s3express permissions
+        return []
+
+async def _list_directory_buckets_async(session) -> List[Dict[str, Any]]:
+    """Async counterpart of _list_directory_buckets_sync."""
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    try:
+        async with session.client("s3", config=async_client_config(best_effort=True)) as s3:
+            if not s3.can_paginate("list_directory_buckets"):
+                return []
+            pages = s3.get_paginator("list_directory_buckets").paginate()
+            return [b async for page in pages for b in page.get("Buckets", [])]
+    except (ClientError, BotoCoreError):
+        return []
+
+async def _list_s3_async(session, region: str):
+    """Fetch bucket locations concurrently, bounded by S3_LOCATION_CONCURRENCY."""
+    import asyncio
+
+    sem = asyncio.Semaphore(S3_LOCATION_CONCURRENCY)
+    async with session.client("s3", config=async_client_config()) as s3:
+        # Both enumerations are independent; overlap them
+        resp, directory_buckets = await asyncio.gather(
+            s3.list_buckets(), _list_directory_buckets_async(session)
+        )
+        buckets = resp.get("Buckets", [])
+
+        async def _loc(name: str):
+            cached = _cached_location(name)
+            if cached:
+                return cached
+            async with sem:
+                loc = await s3.get_bucket_location(Bucket=name)
+            return _remember_location(name, _location_region(loc))
+
+        coros = [_loc(b.get("Name")) for b in buckets]
+        regions = await asyncio.gather(*coros, return_exceptions=True)
+    return _s3_rows(
+        buckets + directory_buckets, regions + [region] * len(directory_buckets), region
+    )
+
+def _list_s3_sync(session, region: str):
+    from concurrent.futures import ThreadPoolExecutor
+    from botocore.exceptions import ClientError
+
+    s3 = session.client("s3", config=client_config())
+    # Created here rather than in the worker: boto3 Sessions aren't thread-safe
+    express = session.client("s3", config=client_config(best_effort=True))
+    # Both enumerations are independent; overlap them
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_buckets = ex.submit(s3.list_buckets)
+        f_directory = ex.submit(_list_directory_buckets_sync, express)
+        resp, directory_buckets = f_buckets.result(), f_directory.result()
     buckets = resp.get("Buckets", [])
+    regions = []
     for b in buckets:
         name = b.get("Name")
-        # Get bucket location
+        cached = _cached_location(name)
+        if cached:
+            regions.append(cached)
+            continue
         try:
-            loc = s3.get_bucket_location(Bucket=name).get("LocationConstraint")
-            # AWS quirk: us-east-1 is reported as None
-            bucket_region = loc or "us-east-1"
+            loc = s3.get_bucket_location(Bucket=name)
+            regions.append(_remember_location(name, _location_region(loc)))
         except ClientError as e:
-            # If access denied to a bucket, skip it gracefully
-            continue
-        if bucket_region == region:
-            created = human_ts(b.get("CreationDate"))
-            rows.append([name, bucket_region, created])
-    print_header(f"S3 Buckets in {region}")
-    print_table(rows, ["BucketName", "Region", "CreationDate"])
+            regions.append(e)
+    return _s3_rows(
+        buckets + directory_buckets, regions + [region] * len(directory_buckets), region
+    )
 
-def list_dynamodb(session, region: str):
-    """List DynamoDB tables in region."""
-    ddb = session.client("dynamodb", region_name=region)
+S3_COLUMNS = [("BucketName", 63), ("Region", 16), ("CreationDate", 19)]
+
+def _async_session(session, region: str):
+    """
+    aioboto3 session reusing the credentials already resolved by the boto3
+    session, or None when aioboto3 is not installed / no credentials resolve
+    (callers then take the sync path, which raises the usual errors).
+    The profile is passed on too so its other settings (endpoint, CA bundle,
+    S3 addressing style, ...) apply; the explicit credentials take priority.
+    """
+    aioboto3 = _aioboto3()
+    creds = session.get_credentials() if aioboto3 is not None else None
+    if creds is None:
+        return None
+    frozen = creds.get_frozen_credentials()
+    # profile_name reads "default" even when no config file defines it, and
+    # naming a missing profile raises ProfileNotFound
+    profile = session.profile_name
+    return aioboto3.Session(
+        aws_access_key_id=frozen.access_key,
+        aws_secret_access_key=frozen.secret_key,
+        aws_session_token=frozen.token,
+        region_name=region,
+        profile_name=profile if profile in session.available_profiles else None,
+    )
+
+def _iter_s3(session, region: str) -> List[List[str]]:
+    async_session = _async_session(session, region)
+    if async_session is None:
+        return _list_s3_sync(session, region)
+    import asyncio
+
+    return asyncio.run(_list_s3_async(async_session, region))
+
+def list_s3(session, region: str, stream: bool = False, out: Optional[TextIO] = None,
+            output: str = "table", collect: Optional[List[Dict[str, str]]] = None):
+    """
+    List S3 buckets whose bucket location matches the requested region.
+    Note: S3 is a global service; each bucket has its own location.
+    """
+    emit("s3", region, S3_COLUMNS, _iter_s3(session, region),
+         stream=stream, out=out, output=output, collect=collect)
+
+DYNAMODB_COLUMNS = [("TableName", 60), ("Status", 35), ("ItemCount", 20), ("SizeBytes", 20)]
+
+def _dynamodb_key_prefix(session, region: str) -> Optional[str]:
+    """
+    Cache key prefix for DynamoDB tables, whose names are only unique per
+    account and region. profile_name is "default" for env-var, SSO and
+    assumed-role credentials alike, so key on a hash of the resolved access
+    key ID instead: an access key belongs to exactly one account, though an
+    account may have many keys. Temporary (ASIA...) credentials get a new
+    key ID whenever they are refreshed, which starts a fresh cache.
+    None (no caching) when no credentials resolve.
+    """
+    creds = session.get_credentials()
+    if creds is None:
+        return None
+    access_key = creds.get_frozen_credentials().access_key
+    digest = hashlib.sha256(access_key.encode()).hexdigest()[:16]
+    return f"{digest}/{region}/"
+
+def _split_cached_tables(tables: List[str], key_prefix: Optional[str]):
+    """Return (rows for tables with a fresh cache entry, tables still to describe)."""
+    if key_prefix is None:
+        return [], list(tables)
+    rows, pending = [], []
+    for table in tables:
+        entry = DYNAMODB_TABLE_CACHE.get(key_prefix + table)
+        if entry:
+            rows.append([table, entry["status"], entry["items"], entry["size"]])
+        else:
+            pending.append(table)
+    return rows, pending
+
+def _table_row(key_prefix: Optional[str], table: str, resp: Any) -> List[str]:
+    """Build a row from a describe_table response (or its ClientError), caching successes."""
+    from botocore.exceptions import ClientError
+
+    if isinstance(resp, ClientError):
+        return [table, "(access denied)", "", ""]
+    if isinstance(resp, BaseException):
+        raise resp
+    desc = resp["Table"]
+    status = desc.get("TableStatus", "")
+    items = str(desc.get("ItemCount", ""))
+    size = str(desc.get("TableSizeBytes", ""))
+    if key_prefix is not None:
+        DYNAMODB_TABLE_CACHE.put(key_prefix + table,
+                                 {"status": status, "items": items, "size": size})
+    return [table, status, items, size]
+
+async def _list_dynamodb_async(session, key_prefix: Optional[str]) -> List[List[str]]:
+    """Describe all tables concurrently on one event loop thread."""
+    import asyncio
+
+    sem = asyncio.Semaphore(DYNAMODB_DESCRIBE_CONCURRENCY)
+    async with session.client("dynamodb", config=async_client_config()) as ddb:
+        paginator = ddb.get_paginator("list_tables")
+        pages = paginator.paginate(PaginationConfig={"PageSize": 100})  # API max for Limit
+        all_tables = [t async for page in pages for t in page.get("TableNames", [])]
+        rows, pending = _split_cached_tables(all_tables, key_prefix)
+
+        async def _describe(table: str):
+            async with sem:
+                return await ddb.describe_table(TableName=table)
+
+        coros = [_describe(t) for t in pending]
+        descs = await asyncio.gather(*coros, return_exceptions=True)
+    rows.extend(_table_row(key_prefix, t, d) for t, d in zip(pending, descs))
+    return rows
+
+def _iter_dynamodb_sync(session, region: str, key_prefix: Optional[str]) -> Iterator[List[str]]:
+    """Yield cached tables first, then others as their describe_table completes."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from botocore.exceptions import ClientError
+
+    # botocore clients are thread-safe; the shared pool covers all workers
+    ddb = session.client("dynamodb", region_name=region, config=client_config())
     paginator = ddb.get_paginator("list_tables")
-    rows = []
-    for page in paginator.paginate():
-        for table in page.get("TableNames", []):
+    pages = paginator.paginate(PaginationConfig={"PageSize": 100})  # API max for Limit
+    all_tables = [t for page in pages for t in page.get("TableNames", [])]
+    rows, pending = _split_cached_tables(all_tables, key_prefix)
+    yield from rows
+    with ThreadPoolExecutor(max_workers=DYNAMODB_DESCRIBE_CONCURRENCY) as ex:
+        futures = {ex.submit(ddb.describe_table, TableName=t): t for t in pending}
+        for fut in as_completed(futures):
             try:
-                desc = ddb.describe_table(TableName=table)["Table"]
-                status = desc.get("TableStatus", "")
-                items = str(desc.get("ItemCount", ""))
-                size = str(desc.get("TableSizeBytes", ""))
-                rows.append([table, status, items, size])
-            except ClientError:
-                rows.append([table, "(access denied)", "", ""])
-    print_header(f"DynamoDB Tables in {region}")
-    print_table(rows, ["TableName", "Status", "ItemCount", "SizeBytes"])
-
-def list_rds(session, region: str):
-    """List RDS DB instances in region."""
-    rds = session.client("rds", region_name=region)
+                resp = fut.result()
+            except ClientError as e:
+                resp = e
+            yield _table_row(key_prefix, futures[fut], resp)
+
+def _iter_dynamodb(session, region: str) -> Iterable[List[str]]:
+    key_prefix = _dynamodb_key_prefix(session, region)
+    async_session = _async_session(session, region)
+    if async_session is None:
+        return _iter_dynamodb_sync(session, region, key_prefix)
+    import asyncio
+
+    return asyncio.run(_list_dynamodb_async(async_session, key_prefix))
+
+def list_dynamodb(session, region: str, stream: bool = False, out: Optional[TextIO] = None,
+                  output: str = "table", collect: Optional[List[Dict[str, str]]] = None):
+    """List DynamoDB tables in region."""
+    rows = _iter_dynamodb(session, region)
+    if not stream:
+        # describe_table results arrive in completion order
+        rows = sorted(rows, key=lambda r: r[0])
+    emit("dynamodb", region, DYNAMODB_COLUMNS, rows,
+         stream=stream, out=out, output=output, collect=collect)
+
+RDS_COLUMNS = [
+    ("Identifier", 63), ("Engine", 20), ("Class", 20),
+    ("Status", 35), ("Endpoint", 60), ("Created", 19),
+]
+
+def _iter_rds(session, region: str) -> Iterator[List[str]]:
+    rds = session.client("rds", region_name=region, config=client_config())
     paginator = rds.get_paginator("describe_db_instances")
-    rows = []
-    for page in paginator.paginate():
+    # MaxRecords accepts 20-100 (default 100); pin it so the ceiling is explicit
+    for page in paginator.paginate(PaginationConfig={"PageSize": 100}):
         for db in page.get("DBInstances", []):
             ident = db.get("DBInstanceIdentifier", "")
             eng = db.get("Engine", "")
@@ -156,24 +611,33 @@ def list_rds(session, region: str):
             status = db.get("DBInstanceStatus", "")
             endpoint = (db.get("Endpoint") or {}).get("Address", "")
             created = human_ts(db.get("InstanceCreateTime"))
-            rows.append([ident, eng, cls, status, endpoint, created])
-    print_header(f"RDS DB Instances in {region}")
-    print_table(rows, ["Identifier", "Engine", "Class", "Status", "Endpoint", "Created"])
+            yield [ident, eng, cls, status, endpoint, created]
 
-def list_lambda(session, region: str):
-    """List Lambda functions in region."""
-    lam = session.client("lambda", region_name=region)
+def list_rds(session, region: str, stream: bool = False, out: Optional[TextIO] = None,
+             output: str = "table", collect: Optional[List[Dict[str, str]]] = None):
+    """List RDS DB instances in region."""
+    emit("rds", region, RDS_COLUMNS, _iter_rds(session, region),
+         stream=stream, out=out, output=output, collect=collect)
+
+LAMBDA_COLUMNS = [("FunctionName", 64), ("Runtime", 16), ("Version", 10), ("LastModified", 28)]
+
+def _iter_lambda(session, region: str) -> Iterator[List[str]]:
+    lam = session.client("lambda", region_name=region, config=client_config())
     paginator = lam.get_paginator("list_functions")
-    rows = []
-    for page in paginator.paginate():
+    # MaxItems accepts up to 10000; the service itself returns at most 50 per call
+    for page in paginator.paginate(PaginationConfig={"PageSize": 10000}):
         for fn in page.get("Functions", []):
             name = fn.get("FunctionName", "")
             runtime = fn.get("Runtime", "")
             ver = fn.get("Version", "")
             last_mod = fn.get("LastModified", "")
-            rows.append([name, runtime, ver, last_mod])
-    print_header(f"Lambda Functions in {region}")
-    print_table(rows, ["FunctionName", "Runtime", "Version", "LastModified"])
+            yield [name, runtime, ver, last_mod]
+
+def list_lambda(session, region: str, stream: bool = False, out: Optional[TextIO] = None,
+                output: str = "table", collect: Optional[List[Dict[str, str]]] = None):
+    """List Lambda functions in region."""
+    emit("lambda", region, LAMBDA_COLUMNS, _iter_lambda(session, region),
+         stream=stream, out=out, output=output, collect=collect)
 
 SUPPORTED = {
     "ec2": list_ec2,
@@ -183,50 +647,203 @@ SUPPORTED = {
     "lambda": list_lambda,
 }
 
+_SUPPORTED_NAMES = tuple(sorted(SUPPORTED))
+_SUPPORTED_HELP = ", ".join(_SUPPORTED_NAMES)
+_SERVICE_CHOICES = _SUPPORTED_NAMES + ("all",)
+
+def _run_section(handler, session, region: str, name: str, kwargs: Dict[str, Any]):
+    """
+    Run one handler for list_all, capturing its output. AWS and SDK errors
+    are returned as a message instead of raised so one failing service
+    doesn't hide the rest.
+    """
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    handled = tuple(t for t in _error_map() if t is not KeyboardInterrupt)
+    out = io.StringIO()
+    try:
+        handler(session, region, out=out, **kwargs)
+    except ClientError as e:
+        return out.getvalue(), client_error_message(e)
+    except handled as e:
+        msg, _ = _error_entry(e)
+        return out.getvalue(), msg.format(region=region, service=name, error=e)
+    except BotoCoreError as e:
+        return out.getvalue(), f"Unexpected error: {e}"
+    return out.getvalue(), None
+
+def _shutdown_now(ex) -> None:
+    """Stop ex without waiting for running work; queued work is dropped on 3.9+."""
+    if sys.version_info >= (3, 9):
+        ex.shutdown(wait=False, cancel_futures=True)
+    else:
+        ex.shutdown(wait=False)
+
+def list_all(region: str, profile: Optional[str] = None, states: Optional[List[str]] = None,
+             output: str = "table") -> bool:
+    """
+    Run every SUPPORTED handler concurrently (each talks to its own endpoint)
+    and print their output in SUPPORTED order. boto3 Sessions are not
+    thread-safe, so each worker gets its own, created here in the calling
+    thread. A service whose calls fail (AccessDenied, a timeout, ...) gets
+    an error line in its section; returns True if any service failed. For
+    output="json" the handlers collect their rows into one document that is
+    encoded once at the end.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    failed = False
+    sections = []  # output="json": one {"service", "rows"[, "error"]} dict each
+    ex = ThreadPoolExecutor(max_workers=len(SUPPORTED))
+    try:
+        futures = []
+        for name, handler in SUPPORTED.items():
+            kwargs = {"output": output}
+            if name == "ec2":
+                kwargs["states"] = states
+            if output == "json":
+                sections.append({"service": name, "rows": []})
+                kwargs["collect"] = sections[-1]["rows"]
+            session = get_session(profile=profile, region=region)
+            fut = ex.submit(_run_section, handler, session, region, name, kwargs)
+            futures.append((name, fut))
+        for i, (name, fut) in enumerate(futures):
+            text, msg = fut.result()
+            sys.stdout.write(text)
+            if msg is None:
+                continue
+            failed = True
+            if output == "json":
+                sections[i]["error"] = msg
+            elif output == "table":
+                print_header(section_title(name, region))
+                print(f"(error: {msg})")
+            elif output == "ndjson":
+                # Keep stdout machine-readable; report the failure on stderr
+                print(f"Error: {name}: {msg}", file=sys.stderr)
+    except BaseException:
+        # Ctrl-C or a bug: don't sit waiting for in-flight API calls
+        _shutdown_now(ex)
+        raise
+    ex.shutdown()
+    if output == "json":
+        sys.stdout.write(_json_dumps()(sections) + "\n")
+    return failed
+
 # -------- Main -------- #
 
-def main():
+# Exception type -> (message template, exit code). Templates may use
+# {region}, {service} and {error}. ClientError is handled separately since
+# its message comes from the response payload.
+@lru_cache(maxsize=None)
+def _error_map():
+    from botocore.exceptions import (
+        ConnectionError as BotoConnectionError,
+        NoCredentialsError,
+        PartialCredentialsError,
+        EndpointConnectionError,
+        UnknownServiceError,
+        ParamValidationError,
+    )
+    return {
+        NoCredentialsError: ("No AWS credentials found. Configure credentials via "
+                             "environment variables or AWS config files.", 1),
+        PartialCredentialsError: ("Partial AWS credentials found. Please complete your "
+                                  "AWS credential configuration.", 1),
+        EndpointConnectionError: ("Could not connect to endpoint for region '{region}'. "
+                                  "Is the region correct? Details: {error}", 1),
+        # Base of ConnectTimeoutError, ReadTimeoutError, ProxyConnectionError, ...
+        BotoConnectionError: ("Connection to AWS failed for region '{region}'. "
+                              "Details: {error}", 1),
+        UnknownServiceError: ("The AWS SDK does not recognize service '{service}'.", 1),
+        ParamValidationError: ("Invalid parameter(s): {error}", 1),
+        KeyboardInterrupt: ("Interrupted by user.", 130),
+    }
+
+def client_error_message(e) -> str:
+    code = e.response.get("Error", {}).get("Code", "Unknown")
+    msg = e.response.get("Error", {}).get("Message", str(e))
+    return f"AWS API error ({code}): {msg}"
+
+def _service_name(value: str) -> str:
+    """argparse type for the service argument; choices are checked afterwards."""
+    return value.lower().strip()
+
+def _error_entry(e: BaseException) -> Tuple[str, int]:
+    # Walk the MRO so subclasses find the closest mapped base, e.g.
+    # ConnectTimeoutError -> botocore ConnectionError
+    err_map = _error_map()
+    return next(err_map[cls] for cls in type(e).__mro__ if cls in err_map)
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="List AWS resources for a given service and region."
     )
-    parser.add_argument("service", help=f"Service name (one of: {', '.join(sorted(SUPPORTED.keys()))})")
+    parser.add_argument("service", type=_service_name, choices=_SERVICE_CHOICES,
+                        help=f"Service name (one of: {_SUPPORTED_HELP}, or 'all')")
     parser.add_argument("region", help="AWS region code (e.g., us-east-1, eu-west-1)")
     parser.add_argument("--profile", help="AWS CLI profile to use (optional)")
-    args = parser.parse_args()
+    parser.add_argument("--state",
+                        help="ec2 only: comma-separated instance states to include "
+                             "(e.g., running,stopped)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Print rows as they arrive using fixed column widths "
+                             "(constant memory)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="table",
+                        help="Output format: aligned table (default), a JSON array, "
+                             "or newline-delimited JSON objects")
+    cache = parser.add_mutually_exclusive_group()
+    cache.add_argument("--no-cache", action="store_true",
+                       help=f"Do not read or write the lookup cache in {CACHE_DIR}")
+    cache.add_argument("--refresh-cache", action="store_true",
+                       help="Ignore cached lookups but store fresh results")
+    return parser
 
-    service = args.service.lower().strip()
+# Built once at import so repeated main() calls (e.g. when embedded) reuse it
+_PARSER = _build_parser()
+
+def main():
+    args = _PARSER.parse_args()
+
+    service = args.service  # already normalized and validated by argparse
     region = args.region.strip()
 
-    if service not in SUPPORTED:
-        fail(
-            f"Unsupported service '{service}'. "
-            f"Supported: {', '.join(sorted(SUPPORTED.keys()))}"
-        )
+    if args.stream and service == "all":
+        # Sections are buffered so they can print in order; streaming would be a lie
+        fail("--stream cannot be combined with 'all'.")
+
+    handler_kwargs = {"output": args.format}
+    if service != "all":
+        handler_kwargs["stream"] = args.stream
+    if args.state:
+        if service not in ("ec2", "all"):
+            fail("--state is only supported for the ec2 service.")
+        handler_kwargs["states"] = [s.strip() for s in args.state.split(",") if s.strip()]
+
+    for c in CACHES:
+        c.enabled = not args.no_cache
+        c.refresh = args.refresh_cache
 
-    # Initialize session (credentials/region taken from args or env/config)
-    session = get_session(profile=args.profile, region=region)
+    from botocore.exceptions import ClientError
 
     try:
-        SUPPORTED[service](session, region)
+        if service == "all":
+            # list_all builds one session per worker thread
+            return 1 if list_all(region, args.profile, **handler_kwargs) else 0
+        # Initialize session (credentials/region taken from args or env/config)
+        session = get_session(profile=args.profile, region=region)
+        SUPPORTED[service](session, region, **handler_kwargs)
         return 0
-    except NoCredentialsError:
-        fail("No AWS credentials found. Configure credentials via environment variables or AWS config files.")
-    except PartialCredentialsError:
-        fail("Partial AWS credentials found. Please complete your AWS credential configuration.")
-    except EndpointConnectionError as e:
-        fail(f"Could not connect to endpoint for region '{region}'. Is the region correct? Details: {e}")
-    except UnknownServiceError:
-        fail(f"The AWS SDK does not recognize service '{service}'.")
+    except tuple(_error_map()) as e:
+        msg, code = _error_entry(e)
+        fail(msg.format(region=region, service=service, error=e), code)
     except ClientError as e:
-        code = e.response.get("Error", {}).get("Code", "Unknown")
-        msg = e.response.get("Error", {}).get("Message", str(e))
-        fail(f"AWS API error ({code}): {msg}")
-    except ParamValidationError as e:
-        fail(f"Invalid parameter(s): {e}")
-    except KeyboardInterrupt:
-        fail("Interrupted by user.", code=130)
+        fail(client_error_message(e))
     except Exception as e:
         fail(f"Unexpected error: {e}")
+    finally:
+        for c in CACHES:
+            c.save()
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file